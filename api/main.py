@@ -1,11 +1,24 @@
 
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
+from api.repositories.postgres_repository import PostgresDB
 from api.routers.journal_router import router as journal_router
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Close the shared database pool when the app shuts down."""
+    yield
+    await PostgresDB.close_shared_pool()
+
+
 # TODO: Setup basic console logging
 # Hint: Use logging.basicConfig() with level=logging.INFO
 # Steps:
@@ -14,7 +27,11 @@ load_dotenv()
 # 3. Add console handler
 # 4. Test by adding a log message when the app starts
 
-app = FastAPI(title="Journal API", description="A simple journal API for tracking daily work, struggles, and intentions")
+app = FastAPI(
+    title="Journal API",
+    description="A simple journal API for tracking daily work, struggles, and intentions",
+    lifespan=lifespan
+)
 app.include_router(journal_router)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 
@@ -10,16 +11,31 @@ class DatabaseInterface(ABC):
         """Create a new journal entry."""
         pass
 
+    @abstractmethod
+    async def create_entries(self, entries_data: list[dict[str, Any]]) -> None:
+        """Create several journal entries in a single batch."""
+        pass
+
     @abstractmethod
     async def get_all_entries(self) -> list[dict[str, Any]]:
         """Retrieve all journal entries."""
         pass
 
+    @abstractmethod
+    async def get_entries_version(self) -> tuple[int, datetime | None]:
+        """Return the entry count and latest update time, which change whenever the entries do."""
+        pass
+
     @abstractmethod
     async def get_entry(self, entry_id: str) -> dict[str, Any] | None:
         """Retrieve a specific journal entry by ID."""
         pass
 
+    @abstractmethod
+    async def get_entries(self, entry_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several journal entries by ID, keyed by ID. Missing IDs are omitted."""
+        pass
+
     @abstractmethod
     async def update_entry(self, entry_id: str, updated_data: dict[str, Any]) -> None:
         """Update an existing journal entry."""
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import os
 import uuid
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Protocol
 
 import asyncpg
 from dotenv import load_dotenv
@@ -15,7 +17,61 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is missing")
 
+class ConnectionPool(Protocol):
+    """Anything that hands out connections the way asyncpg.Pool does."""
+
+    def acquire(self) -> AbstractAsyncContextManager[asyncpg.Connection]: ...
+
+
 class PostgresDB(DatabaseInterface):
+    # One small pool is shared by every PostgresDB instance in the process
+    _shared_pool: asyncpg.Pool | None = None
+    _shared_pool_lock = asyncio.Lock()
+
+    def __init__(self, pool: ConnectionPool | None = None):
+        self._pool = pool
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The pool queries run on; set on construction or when entering the context."""
+        if self._pool is None:
+            raise RuntimeError("PostgresDB has no pool; use it as an async context manager")
+        return self._pool
+
+    @classmethod
+    def from_pool(cls, pool: ConnectionPool) -> "PostgresDB":
+        """Bind to an existing pool instead of the shared one."""
+        return cls(pool)
+
+    @classmethod
+    async def get_shared_pool(cls) -> asyncpg.Pool:
+        """Return the process-wide pool, creating it on first use or after it was closed."""
+        pool = cls._shared_pool
+        if pool is not None and not pool.is_closing():
+            return pool
+
+        async with cls._shared_pool_lock:
+            # Another caller may already have created the pool while we waited.
+            # Dead connections inside a live pool are handled by asyncpg itself.
+            pool = cls._shared_pool
+            if pool is None or pool.is_closing():
+                pool = await asyncpg.create_pool(
+                    DATABASE_URL,
+                    min_size=2,
+                    max_size=4,
+                    max_inactive_connection_lifetime=300
+                )
+                cls._shared_pool = pool
+            return pool
+
+    @classmethod
+    async def close_shared_pool(cls) -> None:
+        """Close the process-wide pool, if it was ever opened."""
+        async with cls._shared_pool_lock:
+            if cls._shared_pool is not None:
+                await cls._shared_pool.close()
+                cls._shared_pool = None
+
     @staticmethod
     def datetime_serialize(obj):
         """Convert datetime objects to ISO format for JSON serialization."""
@@ -24,11 +80,13 @@ class PostgresDB(DatabaseInterface):
         raise TypeError(f"Type {type(obj)} not serializable")
 
     async def __aenter__(self):
-        self.pool = await asyncpg.create_pool(DATABASE_URL)
+        if self._pool is None:
+            self._pool = await PostgresDB.get_shared_pool()
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        await self.pool.close()
+        # The pool is either shared or injected, so it outlives this instance
+        pass
 
     async def create_entry(self, entry_data: dict[str, Any]) -> dict[str, Any]:
         async with self.pool.acquire() as conn:
@@ -61,6 +119,23 @@ class PostgresDB(DatabaseInterface):
                 }
             return {}
 
+    async def create_entries(self, entries_data: list[dict[str, Any]]) -> None:
+        rows = [
+            (
+                entry_data.get("id") or str(uuid.uuid4()),
+                json.dumps(entry_data, default=PostgresDB.datetime_serialize),
+                entry_data["created_at"],
+                entry_data["updated_at"]
+            )
+            for entry_data in entries_data
+        ]
+        async with self.pool.acquire() as conn:
+            query = """
+            INSERT INTO entries (id, data, created_at, updated_at)
+            VALUES ($1, $2, $3, $4)
+            """
+            await conn.executemany(query, rows)
+
     async def get_all_entries(self) -> list[dict[str, Any]]:
         async with self.pool.acquire() as conn:
             query = "SELECT * FROM entries"
@@ -78,6 +153,12 @@ class PostgresDB(DatabaseInterface):
                 })
             return entries
 
+    async def get_entries_version(self) -> tuple[int, datetime | None]:
+        async with self.pool.acquire() as conn:
+            query = "SELECT count(*), max(updated_at) FROM entries"
+            row = await conn.fetchrow(query)
+            return row[0], row[1]
+
     async def get_entry(self, entry_id: str) -> dict[str, Any] | None:
         async with self.pool.acquire() as conn:
             query = "SELECT * FROM entries WHERE id = $1"
@@ -95,6 +176,23 @@ class PostgresDB(DatabaseInterface):
                 }
             return None
 
+    async def get_entries(self, entry_ids: list[str]) -> dict[str, dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            query = "SELECT * FROM entries WHERE id = ANY($1::varchar[])"
+            rows = await conn.fetch(query, entry_ids)
+            entries = {}
+            for row in rows:
+                data = json.loads(row["data"])
+                entries[row["id"]] = {
+                    "id": row["id"],
+                    "work": data["work"],
+                    "struggle": data["struggle"],
+                    "intention": data["intention"],
+                    "created_at": row["created_at"],
+                    "updated_at": row["updated_at"]
+                }
+            return entries
+
     async def update_entry(self, entry_id: str, updated_data: dict[str, Any]) -> None:
         updated_at = datetime.now(UTC)
         updated_data["id"] = entry_id
@@ -117,5 +215,6 @@ class PostgresDB(DatabaseInterface):
 
     async def delete_all_entries(self) -> None:
         async with self.pool.acquire() as conn:
-            query = "DELETE FROM entries"
+            # TRUNCATE drops the table's pages instead of deleting and logging each row
+            query = "TRUNCATE entries"
             await conn.execute(query)
@@ -1,6 +1,8 @@
+import hashlib
 from collections.abc import AsyncGenerator
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from api.models.entry import Entry, EntryCreate
 from api.repositories.postgres_repository import PostgresDB
@@ -8,11 +10,39 @@ from api.services.entry_service import EntryService
 
 router = APIRouter()
 
+# Lets browsers and caching proxies serve repeat reads without reaching the database
+LIST_CACHE_CONTROL = "public, max-age=5"
+ENTRY_CACHE_CONTROL = "public, max-age=30"
+
 
 async def get_entry_service() -> AsyncGenerator[EntryService, None]:
     async with PostgresDB() as db:
         yield EntryService(db)
 
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from values that change whenever the resource does."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (a list of tags or "*") using weak comparison."""
+    opaque_tag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def not_modified(request: Request, headers: dict[str, str]) -> Response | None:
+    """Return a 304 response if the client already holds the version named by headers["ETag"]."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return None
+
 @router.post("/entries")
 async def create_entry(entry_data: EntryCreate, entry_service: EntryService = Depends(get_entry_service)):
     """Create a new journal entry."""
@@ -38,23 +68,41 @@ async def create_entry(entry_data: EntryCreate, entry_service: EntryService = De
 # Implements GET /entries endpoint to list all journal entries
 # Example response: [{"id": "123", "work": "...", "struggle": "...", "intention": "..."}]
 @router.get("/entries")
-async def get_all_entries(entry_service: EntryService = Depends(get_entry_service)):
-    """Get all journal entries."""
+async def get_all_entries(request: Request, response: Response, entry_service: EntryService = Depends(get_entry_service)):
+    """Get all journal entries. Returns 304 if If-None-Match matches the current ETag."""
+    # Computed before fetching, so a concurrent write can only make the ETag stale, never the body
+    headers = {
+        "ETag": make_etag(*await entry_service.get_entries_version()),
+        "Cache-Control": LIST_CACHE_CONTROL
+    }
+    if cached := not_modified(request, headers):
+        return cached
+
     result = await entry_service.get_all_entries()
+    response.headers.update(headers)
     return {"entries": result, "count": len(result)}
 
 @router.get("/entries/{entry_id}")
-async def get_entry(request: Request, entry_id: str, entry_service: EntryService = Depends(get_entry_service)):
-    """ Get one journal entry."""
-    result = await entry_service.get_entry(entry_id)
+async def get_entry(request: Request, response: Response, entry_id: UUID, entry_service: EntryService = Depends(get_entry_service)):
+    """ Get one journal entry. Returns 304 if If-None-Match matches the current ETag."""
+    result = await entry_service.get_entry(str(entry_id))
     if not result:
         raise HTTPException(status_code=404, detail="Entry not found")
+
+    headers = {
+        "ETag": make_etag(result["id"], result["updated_at"]),
+        "Cache-Control": ENTRY_CACHE_CONTROL
+    }
+    if cached := not_modified(request, headers):
+        return cached
+
+    response.headers.update(headers)
     return result
 
 @router.patch("/entries/{entry_id}")
-async def update_entry(entry_id: str, entry_update: dict, entry_service: EntryService = Depends(get_entry_service)):
+async def update_entry(entry_id: UUID, entry_update: dict, entry_service: EntryService = Depends(get_entry_service)):
     """Update a journal entry"""
-    result = await entry_service.update_entry(entry_id, entry_update)
+    result = await entry_service.update_entry(str(entry_id), entry_update)
     if not result:
 
         raise HTTPException(status_code=404, detail="Entry not found")
@@ -64,11 +112,11 @@ async def update_entry(entry_id: str, entry_update: dict, entry_service: EntrySe
 # DELETE /entries/{entry_id} endpoint to remove a specific entry
 # Return 404 if entry not found
 @router.delete("/entries/{entry_id}")
-async def delete_entry(entry_id: str, entry_service: EntryService = Depends(get_entry_service)):
-    existing_entry = await entry_service.get_entry(entry_id)
+async def delete_entry(entry_id: UUID, entry_service: EntryService = Depends(get_entry_service)):
+    existing_entry = await entry_service.get_entry(str(entry_id))
     if not existing_entry:
         raise HTTPException(status_code=404, detail="Entry not found")
-    await entry_service.delete_entry(entry_id)
+    await entry_service.delete_entry(str(entry_id))
     return {"detail": "Entry deleted successfully"}
 
 @router.delete("/entries")
@@ -78,7 +126,7 @@ async def delete_all_entries(entry_service: EntryService = Depends(get_entry_ser
     return {"detail": "All entries deleted"}
 
 @router.post("/entries/{entry_id}/analyze")
-async def analyze_entry(entry_id: str, entry_service: EntryService = Depends(get_entry_service)):
+async def analyze_entry(entry_id: UUID, entry_service: EntryService = Depends(get_entry_service)):
     """
     Analyze a journal entry using AI.
 
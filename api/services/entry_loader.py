@@ -0,0 +1,50 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+BatchLoadFn = Callable[[list[str]], Awaitable[dict[str, dict[str, Any]]]]
+
+
+class EntryLoader:
+    """
+    Coalesces entry lookups made in the same event loop tick into one batch query.
+
+    Every load() call issued before the loop gets back to its scheduled callbacks
+    is collected and resolved by a single call to batch_load_fn. Results are not
+    cached, so a later load() always sees the current state of the database.
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn):
+        self._batch_load_fn = batch_load_fn
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, entry_id: str) -> dict[str, Any] | None:
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        future = loop.create_future()
+        self._pending.setdefault(entry_id, []).append(future)
+        return await future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._load_batch(pending))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, pending: dict[str, list[asyncio.Future]]) -> None:
+        try:
+            entries = await self._batch_load_fn(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for entry_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(entries.get(entry_id))
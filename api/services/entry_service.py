@@ -3,12 +3,15 @@ from datetime import UTC, datetime
 from typing import Any
 
 from api.repositories.postgres_repository import PostgresDB
+from api.services.entry_loader import EntryLoader
 
 logger = logging.getLogger("journal")
 
 class EntryService:
     def __init__(self, db: PostgresDB):
         self.db = db
+        # The service is created per request, so lookups are batched per request too
+        self.entry_loader = EntryLoader(db.get_entries)
         logger.debug("EntryService initialized with PostgresDB client.")
 
     async def create_entry(self, entry_data: dict[str, Any]) -> dict[str, Any]:
@@ -30,10 +33,15 @@ class EntryService:
         logger.debug("Fetched %d entries", len(entries))
         return entries
 
+    async def get_entries_version(self) -> tuple[int, datetime | None]:
+        """Gets the entry count and latest update time."""
+        logger.info("Fetching entries version")
+        return await self.db.get_entries_version()
+
     async def get_entry(self, entry_id: str) -> dict[str, Any] | None:
         """Gets a specific entry."""
         logger.info("Fetching entry %s", entry_id)
-        entry = await self.db.get_entry(entry_id)
+        entry = await self.entry_loader.load(entry_id)
         if entry:
             logger.debug("Entry %s found", entry_id)
         else:
@@ -43,7 +51,7 @@ class EntryService:
     async def update_entry(self, entry_id: str, updated_data: dict[str, Any]) -> dict[str, Any] | None:
         """Updates an existing entry."""
         logger.info("Updating entry %s", entry_id)
-        existing_entry = await self.db.get_entry(entry_id)
+        existing_entry = await self.entry_loader.load(entry_id)
         if not existing_entry:
             logger.warning("Entry %s not found. Update aborted.", entry_id)
             return None
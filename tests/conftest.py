@@ -6,70 +6,145 @@ This file sets up test fixtures that are shared across all tests, including:
 - Test client for making API requests
 - Helper functions for cleaning up test data
 """
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 
+import asyncpg
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from api.main import app
-from api.repositories.postgres_repository import PostgresDB
+from api.models.entry import Entry
+from api.repositories.postgres_repository import DATABASE_URL, PostgresDB
+from api.routers.journal_router import get_entry_service
+from api.services.entry_service import EntryService
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Runs async tests on uvloop, which has lower per-await overhead than the
+    default selector loop. Falls back to the default loop where uvloop is unavailable.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+async def db_pool() -> AsyncGenerator[asyncpg.Pool, None]:
+    """
+    Provides a single connection pool shared by the whole test session.
+    Connections are opened once instead of once per test.
+    """
+    pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
+    yield pool
+    await pool.close()
+
+
+class _ConnectionPool:
+    """
+    Pool-like wrapper that hands out the same connection on every acquire().
+    A lock serializes callers, since one asyncpg connection can only run one query at a time.
+    """
+
+    def __init__(self, con: asyncpg.Connection):
+        self._con = con
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[asyncpg.Connection, None]:
+        async with self._lock:
+            yield self._con
 
 
 @pytest.fixture(autouse=True)
-async def cleanup_database():
+async def cleanup_database(db_pool: asyncpg.Pool) -> AsyncGenerator[PostgresDB, None]:
     """
-    Automatically clean up the database before each test.
-    This ensures test isolation.
+    Automatically runs each test inside a transaction that is rolled back afterwards.
+    The table is emptied inside the transaction, so each test starts clean while
+    existing rows (e.g. entries created through /docs) come back on rollback.
+    Both the API (via a dependency override) and test_db share the transaction's
+    connection, so nothing a test writes is ever committed.
     """
-    async with PostgresDB() as db:
-        await db.delete_all_entries()
-    yield
-    # Clean up after test as well
-    async with PostgresDB() as db:
-        await db.delete_all_entries()
+    async with db_pool.acquire() as con:
+        transaction = con.transaction()
+        await transaction.start()
+        db = PostgresDB.from_pool(_ConnectionPool(con))
+        try:
+            await db.delete_all_entries()
+            app.dependency_overrides[get_entry_service] = lambda: EntryService(db)
+            yield db
+        finally:
+            app.dependency_overrides.pop(get_entry_service, None)
+            await transaction.rollback()
 
 
 @pytest.fixture
-async def test_db() -> AsyncGenerator[PostgresDB, None]:
+def test_db(cleanup_database: PostgresDB) -> PostgresDB:
     """
     Provides a test database connection.
-    The cleanup is handled by the cleanup_database fixture.
+    It is bound to the per-test transaction opened by cleanup_database.
     """
-    async with PostgresDB() as db:
-        yield db
+    return cleanup_database
 
 
 @pytest.fixture
+def seed_entries(test_db: PostgresDB) -> Callable[[int], Awaitable[list[dict]]]:
+    """
+    Provides a helper that inserts n entries with a single bulk insert.
+    Useful for tests that only need rows to exist, bypassing the API.
+    """
+    async def seed(n: int) -> list[dict]:
+        entries = [
+            Entry(work=f"Work item {i}", struggle="Struggle", intention="Intention").model_dump()
+            for i in range(n)
+        ]
+        await test_db.create_entries(entries)
+        return entries
+
+    return seed
+
+
+@pytest.fixture(scope="session")
 async def test_client() -> AsyncGenerator[AsyncClient, None]:
     """
     Provides an async HTTP client for testing the FastAPI application.
     This client can make requests to the API without starting a server.
+    It holds no per-test state, so one client is shared by the whole session.
     """
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
         yield client
 
 
-@pytest.fixture
-def sample_entry_data() -> dict:
+@pytest.fixture(scope="session")
+def sample_entry_data() -> Mapping[str, str]:
     """
     Provides sample entry data for testing.
     This can be used to create test entries consistently across tests.
+    The mapping is read-only because it is shared by the whole session.
     """
-    return {
+    return MappingProxyType({
         "work": "Studied FastAPI and built my first API endpoints",
         "struggle": "Understanding async/await syntax and when to use it",
         "intention": "Practice PostgreSQL queries and database design"
-    }
+    })
 
 
 @pytest.fixture
-async def created_entry(test_client: AsyncClient, sample_entry_data: dict) -> dict:
+async def created_entry(test_client: AsyncClient, sample_entry_data: Mapping[str, str]) -> dict:
     """
     Creates a sample entry and returns it.
     This fixture is useful for tests that need an existing entry.
     """
-    response = await test_client.post("/entries", json=sample_entry_data)
+    response = await test_client.post("/entries", json=dict(sample_entry_data))
     assert response.status_code == 200
     result = response.json()
     return result["entry"]
+
@@ -8,16 +8,52 @@ These tests verify that the API endpoints work correctly, including:
 - Deleting entries
 - Error handling (404, validation errors, etc.)
 """
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+
+from api.main import app
+from api.routers.journal_router import get_entry_service
+
+SeedEntries = Callable[[int], Awaitable[list[dict]]]
+_FAKE_UUID = "00000000-0000-0000-0000-000000000000"
+_OVERSIZE = "a" * 300  # Exceeds the 256 character field limit
+
+
+async def _probe_status(method: str, path: str) -> int:
+    # The None service makes implemented endpoints fail with 500 instead of raising
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.request(method, path)
+        return response.status_code
+
+
+def _is_implemented(method: str, path: str) -> bool:
+    """
+    Probe an endpoint once at collection time, so unimplemented endpoints are skipped
+    without a request per test. Stub endpoints raise 501 before touching the service,
+    so the service dependency is replaced with None and the probe never hits the database.
+    """
+    app.dependency_overrides[get_entry_service] = lambda: None
+    try:
+        return asyncio.run(_probe_status(method, path)) != 501
+    finally:
+        app.dependency_overrides.pop(get_entry_service, None)
+
+
+GET_BY_ID_IMPLEMENTED = _is_implemented("GET", f"/entries/{_FAKE_UUID}")
+DELETE_BY_ID_IMPLEMENTED = _is_implemented("DELETE", f"/entries/{_FAKE_UUID}")
+ANALYZE_IMPLEMENTED = _is_implemented("POST", f"/entries/{_FAKE_UUID}/analyze")
 
 
 class TestCreateEntry:
     """Tests for POST /entries endpoint."""
 
-    async def test_create_entry_success(self, test_client: AsyncClient, sample_entry_data: dict):
+    async def test_create_entry_success(self, test_client: AsyncClient, sample_entry_data: Mapping[str, str]):
         """Test successfully creating a new journal entry."""
-        response = await test_client.post("/entries", json=sample_entry_data)
+        response = await test_client.post("/entries", json=dict(sample_entry_data))
 
         assert response.status_code == 200
         result = response.json()
@@ -50,7 +86,7 @@ class TestCreateEntry:
     async def test_create_entry_exceeds_max_length(self, test_client: AsyncClient):
         """Test that creating an entry with fields exceeding max length returns validation error."""
         invalid_data = {
-            "work": "a" * 300,  # Exceeds 256 character limit
+            "work": _OVERSIZE,
             "struggle": "Understanding async",
             "intention": "Practice more"
         }
@@ -88,13 +124,10 @@ class TestGetAllEntries:
         assert entry["id"] == created_entry["id"]
         assert entry["work"] == created_entry["work"]
 
-    async def test_get_all_entries_multiple(self, test_client: AsyncClient, sample_entry_data: dict):
+    async def test_get_all_entries_multiple(self, test_client: AsyncClient, seed_entries: SeedEntries):
         """Test getting all entries when database has multiple entries."""
         # Create multiple entries
-        for i in range(3):
-            entry_data = sample_entry_data.copy()
-            entry_data["work"] = f"Work item {i}"
-            await test_client.post("/entries", json=entry_data)
+        await seed_entries(3)
 
         response = await test_client.get("/entries")
 
@@ -103,7 +136,59 @@ class TestGetAllEntries:
         assert result["count"] == 3
         assert len(result["entries"]) == 3
 
+    async def test_get_all_entries_cache_control(self, test_client: AsyncClient):
+        """Test that the list response allows short-lived caching."""
+        response = await test_client.get("/entries")
+
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "public, max-age=5"
+
+    async def test_get_all_entries_not_modified(self, test_client: AsyncClient, created_entry: dict):
+        """Test that a conditional GET with the current ETag returns 304 without a body."""
+        response = await test_client.get("/entries")
+        etag = response.headers["ETag"]
+
+        response = await test_client.get("/entries", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    async def test_get_all_entries_not_modified_etag_list(self, test_client: AsyncClient, created_entry: dict):
+        """Test that If-None-Match matches any tag in a list, ignoring the weak W/ prefix."""
+        response = await test_client.get("/entries")
+        etag = response.headers["ETag"]
+
+        if_none_match = f'W/"some-other-version", {etag.removeprefix("W/")}'
+        response = await test_client.get("/entries", headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    async def test_get_all_entries_not_modified_wildcard(self, test_client: AsyncClient):
+        """Test that If-None-Match: * matches the current list."""
+        response = await test_client.get("/entries", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 304
 
+    async def test_get_all_entries_etag_changes(
+        self, test_client: AsyncClient, created_entry: dict, sample_entry_data: Mapping[str, str]
+    ):
+        """Test that the ETag no longer matches once the entries change."""
+        response = await test_client.get("/entries")
+        etag = response.headers["ETag"]
+
+        await test_client.post("/entries", json=dict(sample_entry_data))
+        response = await test_client.get("/entries", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["count"] == 2
+
+
+@pytest.mark.skipif(
+    not GET_BY_ID_IMPLEMENTED, reason="GET /entries/{id} endpoint not yet implemented by student"
+)
 class TestGetSingleEntry:
     """Tests for GET /entries/{entry_id} endpoint."""
 
@@ -112,12 +197,6 @@ class TestGetSingleEntry:
         entry_id = created_entry["id"]
         response = await test_client.get(f"/entries/{entry_id}")
 
-        # This endpoint returns 501 (Not Implemented) until students implement it
-        # When implemented, it should return 200 with the entry
-        if response.status_code == 501:
-            # Expected for unimplemented endpoint
-            pytest.skip("GET /entries/{id} endpoint not yet implemented by student")
-
         assert response.status_code == 200
         entry = response.json()
         assert entry["id"] == created_entry["id"]
@@ -125,15 +204,28 @@ class TestGetSingleEntry:
 
     async def test_get_entry_not_found(self, test_client: AsyncClient):
         """Test that retrieving a non-existent entry returns 404."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = await test_client.get(f"/entries/{fake_id}")
-
-        # Skip if not implemented yet
-        if response.status_code == 501:
-            pytest.skip("GET /entries/{id} endpoint not yet implemented by student")
+        response = await test_client.get(f"/entries/{_FAKE_UUID}")
 
         assert response.status_code == 404
 
+    async def test_get_entry_invalid_id(self, test_client: AsyncClient):
+        """Test that an ID that is not a UUID is rejected with a validation error."""
+        response = await test_client.get("/entries/not-a-uuid")
+
+        assert response.status_code == 422
+
+    async def test_get_entry_not_modified(self, test_client: AsyncClient, created_entry: dict):
+        """Test that a conditional GET with the entry's current ETag returns 304."""
+        entry_id = created_entry["id"]
+        response = await test_client.get(f"/entries/{entry_id}")
+
+        etag = response.headers["ETag"]
+        response = await test_client.get(f"/entries/{entry_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["Cache-Control"] == "public, max-age=30"
+        assert response.content == b""
+
 
 class TestUpdateEntry:
     """Tests for PATCH /entries/{entry_id} endpoint."""
@@ -156,14 +248,16 @@ class TestUpdateEntry:
 
     async def test_update_entry_not_found(self, test_client: AsyncClient):
         """Test that updating a non-existent entry returns 404."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
         update_data = {"work": "Updated work"}
 
-        response = await test_client.patch(f"/entries/{fake_id}", json=update_data)
+        response = await test_client.patch(f"/entries/{_FAKE_UUID}", json=update_data)
 
         assert response.status_code == 404
 
 
+@pytest.mark.skipif(
+    not DELETE_BY_ID_IMPLEMENTED, reason="DELETE /entries/{id} endpoint not yet implemented by student"
+)
 class TestDeleteEntry:
     """Tests for DELETE /entries/{entry_id} endpoint."""
 
@@ -172,10 +266,6 @@ class TestDeleteEntry:
         entry_id = created_entry["id"]
         response = await test_client.delete(f"/entries/{entry_id}")
 
-        # This endpoint returns 501 (Not Implemented) until students implement it
-        if response.status_code == 501:
-            pytest.skip("DELETE /entries/{id} endpoint not yet implemented by student")
-
         assert response.status_code == 200
 
         # Verify the entry was actually deleted
@@ -185,12 +275,7 @@ class TestDeleteEntry:
 
     async def test_delete_entry_not_found(self, test_client: AsyncClient):
         """Test that deleting a non-existent entry returns 404."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = await test_client.delete(f"/entries/{fake_id}")
-
-        # Skip if not implemented yet
-        if response.status_code == 501:
-            pytest.skip("DELETE /entries/{id} endpoint not yet implemented by student")
+        response = await test_client.delete(f"/entries/{_FAKE_UUID}")
 
         assert response.status_code == 404
 
@@ -198,13 +283,10 @@ class TestDeleteEntry:
 class TestDeleteAllEntries:
     """Tests for DELETE /entries endpoint."""
 
-    async def test_delete_all_entries_success(self, test_client: AsyncClient, sample_entry_data: dict):
+    async def test_delete_all_entries_success(self, test_client: AsyncClient, seed_entries: SeedEntries):
         """Test successfully deleting all entries."""
         # Create multiple entries
-        for i in range(3):
-            entry_data = sample_entry_data.copy()
-            entry_data["work"] = f"Work item {i}"
-            await test_client.post("/entries", json=entry_data)
+        await seed_entries(3)
 
         # Delete all entries
         response = await test_client.delete("/entries")
@@ -229,13 +311,11 @@ class TestAnalyzeEntry:
         # This endpoint returns 501 (Not Implemented) until students implement it
         assert response.status_code == 501
 
+    @pytest.mark.skipif(
+        not ANALYZE_IMPLEMENTED, reason="POST /entries/{id}/analyze endpoint not yet implemented by student"
+    )
     async def test_analyze_entry_not_found(self, test_client: AsyncClient):
         """Test that analyzing a non-existent entry returns 404."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = await test_client.post(f"/entries/{fake_id}/analyze")
-
-        # Skip if not implemented yet, or expect 404 if it is
-        if response.status_code == 501:
-            pytest.skip("POST /entries/{id}/analyze endpoint not yet implemented by student")
+        response = await test_client.post(f"/entries/{_FAKE_UUID}/analyze")
 
         assert response.status_code == 404
@@ -14,6 +14,9 @@ from pydantic import ValidationError
 
 from api.models.entry import AnalysisResponse, Entry, EntryCreate
 
+_ENTRY_UUID = "123e4567-e89b-12d3-a456-426614174000"
+_OVERSIZE = "a" * 300  # Exceeds the 256 character field limit
+
 
 class TestEntryCreateModel:
     """Tests for the EntryCreate model used for API input."""
@@ -44,7 +47,7 @@ class TestEntryCreateModel:
     def test_entry_create_max_length_validation(self):
         """Test that fields exceeding max length are rejected."""
         invalid_data = {
-            "work": "a" * 300,  # Exceeds 256 character limit
+            "work": _OVERSIZE,
             "struggle": "Understanding async",
             "intention": "Practice more"
         }
@@ -72,7 +75,7 @@ class TestEntryModel:
     def test_entry_with_all_fields(self):
         """Test creating an Entry with all fields provided."""
         data = {
-            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "id": _ENTRY_UUID,
             "work": "Studied FastAPI",
             "struggle": "Understanding async",
             "intention": "Practice more",
@@ -121,7 +124,7 @@ class TestEntryModel:
     def test_entry_max_length_validation(self):
         """Test that fields exceeding max length are rejected."""
         invalid_data = {
-            "work": "a" * 300,
+            "work": _OVERSIZE,
             "struggle": "Understanding async",
             "intention": "Practice more"
         }
@@ -155,7 +158,7 @@ class TestAnalysisResponseModel:
     def test_analysis_response_valid(self):
         """Test creating a valid AnalysisResponse model."""
         data = {
-            "entry_id": "123e4567-e89b-12d3-a456-426614174000",
+            "entry_id": _ENTRY_UUID,
             "sentiment": "positive",
             "summary": "The learner made progress. They're excited to continue.",
             "topics": ["FastAPI", "PostgreSQL", "API development"]
@@ -171,7 +174,7 @@ class TestAnalysisResponseModel:
     def test_analysis_response_auto_generates_timestamp(self):
         """Test that AnalysisResponse auto-generates created_at."""
         data = {
-            "entry_id": "123e4567-e89b-12d3-a456-426614174000",
+            "entry_id": _ENTRY_UUID,
             "sentiment": "neutral",
             "summary": "The learner is making steady progress with their studies.",
             "topics": ["learning", "progress"]
@@ -184,7 +187,7 @@ class TestAnalysisResponseModel:
     def test_analysis_response_missing_required_field(self):
         """Test that missing required fields raise validation error."""
         incomplete_data = {
-            "entry_id": "123e4567-e89b-12d3-a456-426614174000",
+            "entry_id": _ENTRY_UUID,
             "sentiment": "positive"
             # Missing summary and topics
         }
@@ -195,7 +198,7 @@ class TestAnalysisResponseModel:
     def test_analysis_response_invalid_topics_type(self):
         """Test that topics must be a list."""
         invalid_data = {
-            "entry_id": "123e4567-e89b-12d3-a456-426614174000",
+            "entry_id": _ENTRY_UUID,
             "sentiment": "positive",
             "summary": "Summary text",
             "topics": "not a list"  # Should be a list
@@ -0,0 +1,56 @@
+"""
+Tests for the PostgresDB connection pool.
+
+The API tests route requests through a per-test transaction, so these tests
+cover the process-wide pool that the real get_entry_service dependency uses:
+- Sharing one pool between PostgresDB instances
+- Replacing a pool that has been closed
+- Closing the pool when the app shuts down
+"""
+import pytest
+
+from api.main import app
+from api.repositories.postgres_repository import PostgresDB
+from api.routers.journal_router import get_entry_service
+
+
+@pytest.fixture(autouse=True)
+async def reset_shared_pool():
+    """Close the shared pool after each test so every test starts without one."""
+    await PostgresDB.close_shared_pool()
+    yield
+    await PostgresDB.close_shared_pool()
+
+
+class TestSharedPool:
+    """Tests for PostgresDB's process-wide connection pool."""
+
+    async def test_pool_is_shared(self):
+        """Test that PostgresDB instances and the API dependency all use the same pool."""
+        async with PostgresDB() as first, PostgresDB() as second:
+            assert first.pool is second.pool
+            assert first.pool is PostgresDB._shared_pool
+
+        # Exiting the context leaves the shared pool open
+        assert not first.pool.is_closing()
+
+        async for entry_service in get_entry_service():
+            assert entry_service.db.pool is first.pool
+
+    async def test_pool_is_replaced_after_close(self):
+        """Test that a closed pool is replaced with a working one."""
+        pool = await PostgresDB.get_shared_pool()
+        await pool.close()
+
+        new_pool = await PostgresDB.get_shared_pool()
+
+        assert new_pool is not pool
+        assert await new_pool.fetchval("SELECT 1") == 1
+
+    async def test_pool_is_closed_on_shutdown(self):
+        """Test that the app lifespan closes and clears the shared pool."""
+        async with app.router.lifespan_context(app):
+            pool = await PostgresDB.get_shared_pool()
+
+        assert pool.is_closing()
+        assert PostgresDB._shared_pool is None
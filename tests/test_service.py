@@ -4,6 +4,10 @@ Tests for the EntryService layer.
 These tests verify that the service layer correctly interacts with the database
 and handles business logic properly.
 """
+import asyncio
+
+import pytest
+
 from api.repositories.postgres_repository import PostgresDB
 from api.services.entry_service import EntryService
 
@@ -35,14 +39,15 @@ class TestEntryService:
         service = EntryService(test_db)
 
         # Create a few entries
-        for i in range(3):
-            entry_data = {
+        await asyncio.gather(*(
+            service.create_entry({
                 "id": f"test-{i}",
                 "work": f"Work {i}",
                 "struggle": "Struggle",
                 "intention": "Intention"
-            }
-            await service.create_entry(entry_data)
+            })
+            for i in range(3)
+        ))
 
         # Get all entries
         result = await service.get_all_entries()
@@ -78,6 +83,62 @@ class TestEntryService:
 
         assert result is None
 
+    async def test_get_entries_concurrently(self, test_db: PostgresDB, monkeypatch: pytest.MonkeyPatch):
+        """Test that concurrent lookups are batched and each resolves to its own entry."""
+        # Record every batch query; patched before the service binds get_entries
+        batches = []
+        get_entries = test_db.get_entries
+
+        async def spy_get_entries(entry_ids: list[str]):
+            batches.append(entry_ids)
+            return await get_entries(entry_ids)
+
+        monkeypatch.setattr(test_db, "get_entries", spy_get_entries)
+        service = EntryService(test_db)
+
+        await asyncio.gather(*(
+            service.create_entry({
+                "id": f"test-{i}",
+                "work": f"Work {i}",
+                "struggle": "Struggle",
+                "intention": "Intention"
+            })
+            for i in range(2)
+        ))
+
+        # Look up existing, duplicate and missing IDs in the same tick
+        results = await asyncio.gather(
+            service.get_entry("test-0"),
+            service.get_entry("test-1"),
+            service.get_entry("test-0"),
+            service.get_entry("nonexistent-id")
+        )
+
+        assert [entry["id"] if entry else None for entry in results] == [
+            "test-0", "test-1", "test-0", None
+        ]
+        assert results[1] is not None
+        assert results[1]["work"] == "Work 1"
+        # Duplicate IDs are fetched once, in a single query
+        assert batches == [["test-0", "test-1", "nonexistent-id"]]
+
+    async def test_get_entries_concurrently_error(self, test_db: PostgresDB, monkeypatch: pytest.MonkeyPatch):
+        """Test that a failed batch query is raised to every concurrent lookup."""
+        async def failing_get_entries(entry_ids: list[str]):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(test_db, "get_entries", failing_get_entries)
+        service = EntryService(test_db)
+
+        results = await asyncio.gather(
+            service.get_entry("test-0"),
+            service.get_entry("test-1"),
+            return_exceptions=True
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(result, RuntimeError) for result in results)
+
     async def test_update_entry(self, test_db: PostgresDB):
         """Test updating an existing entry."""
         service = EntryService(test_db)
@@ -138,14 +199,15 @@ class TestEntryService:
         service = EntryService(test_db)
 
         # Create multiple entries
-        for i in range(3):
-            entry_data = {
+        await asyncio.gather(*(
+            service.create_entry({
                 "id": f"test-{i}",
                 "work": f"Work {i}",
                 "struggle": "Struggle",
                 "intention": "Intention"
-            }
-            await service.create_entry(entry_data)
+            })
+            for i in range(3)
+        ))
 
         # Verify entries exist
         entries = await service.get_all_entries()